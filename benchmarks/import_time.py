@@ -0,0 +1,78 @@
+"""Import time benchmark using `python -X importtime`.
+
+Imports `facturapi` (and optionally touches its resources) in fresh
+interpreters, reports the median cumulative import time and fails if
+it's above the budget.
+
+    python benchmarks/import_time.py --budget-ms 5
+    python benchmarks/import_time.py --statement 'facturapi.Invoice' \
+        --budget-ms 400
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+
+IMPORTTIME_RE = re.compile(
+    r'^import time:\s+\d+ \|\s+(?P<cumulative>\d+) \| (?P<module>\S.*)$'
+)
+
+
+def top_level_imports(statement: str) -> dict[str, int]:
+    """Cumulative microseconds of each top level import in `statement`."""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = {}
+    for line in result.stderr.splitlines():
+        m = IMPORTTIME_RE.match(line)
+        # nested imports are already included in their parent's time
+        if m and not m.group('module').startswith(' '):
+            imports[m.group('module')] = int(m.group('cumulative'))
+    return imports
+
+
+def import_time(statement: str) -> float:
+    """Milliseconds spent importing modules in `statement`.
+
+    Modules imported by the interpreter on startup aren't counted.
+    """
+    startup = top_level_imports('pass')
+    imports = top_level_imports(statement)
+    return (
+        sum(time for module, time in imports.items() if module not in startup)
+        / 1000
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    parser.add_argument('--budget-ms', type=float, default=5.0)
+    parser.add_argument(
+        '--statement',
+        default='',
+        help='statement to run after `import facturapi`',
+    )
+    args = parser.parse_args()
+
+    statement = 'import facturapi'
+    if args.statement:
+        statement += f'; {args.statement}'
+    timings = [import_time(statement) for _ in range(args.runs)]
+    median = statistics.median(timings)
+    print(
+        f'{statement!r}: median={median:.2f}ms min={min(timings):.2f}ms '
+        f'budget={args.budget_ms:.2f}ms'
+    )
+    if median > args.budget_ms:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,127 @@
+"""End-to-end throughput benchmark against the in-process Facturapi fake.
+
+Measures `Invoice.create`, `Queryable.all` and `Downloadable.download`
+through the real client stack (httpx, pydantic validation) and reports
+p50/p99 latencies and requests per second.
+
+    python benchmarks/throughput.py --operations 500 --threads 8 \
+        --latency 0.005
+"""
+
+import argparse
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+import facturapi
+from facturapi.http import client
+from facturapi.resources.invoices import InvoiceRequest
+from facturapi.testing import FakeFacturapi
+from facturapi.types import FileType, PaymentForm
+
+
+def invoice_request(customer_id: str) -> InvoiceRequest:
+    return InvoiceRequest(
+        customer=customer_id,
+        items=[
+            dict(
+                product=dict(
+                    description='Producto Test',
+                    product_key='50202201',
+                    price=42.05,
+                ),
+                quantity=2,
+            )
+        ],
+        payment_form=PaymentForm.transferencia_electronica_de_fondos,
+    )
+
+
+def run(
+    name: str,
+    operation: Callable[[int], int],
+    operations: int,
+    threads: int,
+) -> None:
+    """Run `operation` and print its stats.
+
+    `operation` receives the iteration number and returns the
+    number of HTTP requests it performed.
+    """
+
+    def timed(i: int) -> tuple[float, int]:
+        start = time.perf_counter()
+        requests = operation(i)
+        return time.perf_counter() - start, requests
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        results = list(pool.map(timed, range(operations)))
+    elapsed = time.perf_counter() - start
+
+    latencies = sorted(latency for latency, _ in results)
+    requests = sum(requests for _, requests in results)
+    p50 = statistics.median(latencies) * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f'{name:<10} ops={operations:<6} p50={p50:8.2f}ms '
+        f'p99={p99:8.2f}ms req/s={requests / elapsed:10.1f}'
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--operations', type=int, default=200)
+    parser.add_argument('--threads', type=int, default=4)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--page-size', type=int, default=50)
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='go through a local HTTP server instead of a mock transport',
+    )
+    args = parser.parse_args()
+
+    fake = FakeFacturapi(latency=args.latency, seed=0)
+    customer = fake.create_customer(
+        dict(legal_name='Remedios Varo', tax_id='VAUR631216M55')
+    )
+    request = invoice_request(customer['id'])
+    invoice_ids: list[str] = []
+
+    def create(_: int) -> int:
+        invoice_ids.append(facturapi.Invoice.create(request).id)
+        return 1
+
+    def list_all(_: int) -> int:
+        pages = 0
+        for i, _ in enumerate(facturapi.Invoice.all(limit=args.page_size)):
+            pages += i % args.page_size == 0
+        return pages
+
+    def download(i: int) -> int:
+        file_type = (FileType.pdf, FileType.xml, FileType.zip)[i % 3]
+        facturapi.Invoice.download(
+            invoice_ids[i % len(invoice_ids)], file_type
+        )
+        return 1
+
+    def benchmark() -> None:
+        run('create', create, args.operations, args.threads)
+        run('all', list_all, args.threads, args.threads)
+        run('download', download, args.operations, args.threads)
+
+    client.configure('sk_test_benchmark')
+    if args.serve:
+        client.scheme = 'http'
+        with fake.serve() as host:
+            client.host = host
+            benchmark()
+    else:
+        with fake.patch(client):
+            benchmark()
+
+
+if __name__ == '__main__':
+    main()
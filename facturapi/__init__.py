@@ -3,10 +3,39 @@ __all__ = [
     'Customer',
     'Invoice',
     'configure',
+    'using',
 ]
 
-from .http import client
-from .resources import Customer, Invoice
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .version import __version__
 
-configure = client.configure
+if TYPE_CHECKING:  # pragma: no cover
+    from .http import client, using
+    from .resources import Customer, Invoice
+
+    configure = client.configure
+
+# Attributes are imported on first access so `import facturapi` doesn't
+# load httpx, pydantic or the resources until they're needed.
+_lazy_attributes = dict(
+    Customer='.resources',
+    Invoice='.resources',
+    client='.http',
+    using='.http',
+)
+_submodules = {'http', 'resources', 'testing', 'types'}
+
+
+def __getattr__(name: str) -> Any:
+    if name == 'configure':
+        value = import_module('.http', __name__).client.configure
+    elif name in _lazy_attributes:
+        value = getattr(import_module(_lazy_attributes[name], __name__), name)
+    elif name in _submodules:
+        value = import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
@@ -1,3 +1,20 @@
+__all__ = [
+    'CircuitBreaker',
+    'Client',
+    'ClientRegistry',
+    'client',
+    'get_client',
+    'registry',
+    'using',
+]
+
+from .breaker import CircuitBreaker
 from .client import Client
+from .registry import ClientRegistry, active_client, registry, using
 
 client = Client()
+
+
+def get_client() -> Client:
+    """Client selected with `using()` or the default `client`."""
+    return active_client.get() or client
@@ -0,0 +1,199 @@
+"""Circuit breaker for Facturapi endpoints.
+
+While Facturapi (or SAT stamping) is degraded every request waits for
+the whole timeout before failing. The `CircuitBreaker` tracks the error
+rate and latency of each endpoint and, once they cross a threshold,
+opens the endpoint's circuit: requests fail immediately with
+`CircuitOpenError` until `reset_timeout` passes. Then a few trial
+requests are let through (half-open) and, if they succeed, the circuit
+closes again.
+
+The breaker doesn't perform requests itself, `allow()` and `record()`
+can be called around any client, sync or async, and `guard()` wraps a
+block of code with them.
+"""
+
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from enum import Enum
+from typing import Callable, Iterator
+from urllib.parse import urlsplit
+
+from ..types.exc import CircuitOpenError, FacturapiResponseException
+
+
+class CircuitState(str, Enum):
+    closed = 'closed'
+    open = 'open'
+    half_open = 'half_open'
+
+
+class _Circuit:
+    def __init__(self) -> None:
+        self.state = CircuitState.closed
+        self.calls: deque[tuple[float, bool]] = deque()
+        self.opened_at = 0.0
+        self.trials = 0
+
+
+def endpoint_key(method: str, endpoint: str) -> str:
+    """Key of an endpoint regardless of the resource ID.
+
+    i.e. `GET invoices/{id}/pdf` for `/invoices/INVOICE01/pdf`.
+    """
+    parts = urlsplit(endpoint).path.strip('/').split('/')
+    if len(parts) > 1:
+        parts[1] = '{id}'
+    return f'{method.upper()} {"/".join(parts)}'
+
+
+def is_failure(exc: Exception) -> bool:
+    """If an exception means that Facturapi is unhealthy.
+
+    Client errors (4xx) mean the request was wrong, not that the
+    service is down, except for `429 Too Many Requests`.
+    """
+    if isinstance(exc, FacturapiResponseException):
+        return exc.status_code >= 500 or exc.status_code == 429
+    return True
+
+
+class CircuitBreaker:
+    """Per endpoint circuit breaker.
+
+    Args:
+        failure_rate: Ratio of failed calls, within `window`, that
+            opens the circuit.
+        min_calls: Min number of calls within `window` before the
+            failure rate is taken into account.
+        window: Seconds of calls taken into account.
+        slow_call: Calls slower than these seconds count as failures.
+            Defaults to `None`, latency isn't taken into account.
+        reset_timeout: Seconds an open circuit waits before letting
+            trial calls through.
+        half_open_calls: Number of trial calls while half-open.
+        clock: Monotonic clock, in seconds.
+
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        min_calls: int = 10,
+        window: float = 30.0,
+        slow_call: float | None = None,
+        reset_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.slow_call = slow_call
+        self.reset_timeout = reset_timeout
+        self.half_open_calls = half_open_calls
+        self.clock = clock
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def state(self, key: str) -> CircuitState:
+        """State of an endpoint's circuit."""
+        with self._lock:
+            circuit = self._circuits.get(key)
+            if circuit is None:
+                return CircuitState.closed
+            self._update(circuit)
+            return circuit.state
+
+    def allow(self, key: str) -> None:
+        """Check if a call to the endpoint can be performed.
+
+        Raises:
+            CircuitOpenError: If the endpoint's circuit is open, or
+                half-open with all its trial calls in flight.
+
+        """
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            self._update(circuit)
+            if circuit.state is CircuitState.closed:
+                return
+            if (
+                circuit.state is CircuitState.half_open
+                and circuit.trials < self.half_open_calls
+            ):
+                circuit.trials += 1
+                return
+            retry_after = max(
+                circuit.opened_at + self.reset_timeout - self.clock(), 0.0
+            )
+        raise CircuitOpenError(endpoint=key, retry_after=retry_after)
+
+    def record(self, key: str, success: bool, latency: float = 0.0) -> None:
+        """Record the outcome of a call allowed by `allow()`."""
+        if self.slow_call is not None and latency > self.slow_call:
+            success = False
+        now = self.clock()
+        with self._lock:
+            circuit = self._circuits.setdefault(key, _Circuit())
+            if circuit.state is CircuitState.half_open:
+                if success:
+                    circuit.state = CircuitState.closed
+                    circuit.calls.clear()
+                else:
+                    self._open(circuit, now)
+                return
+            if circuit.state is CircuitState.open:
+                return
+            circuit.calls.append((now, success))
+            self._evict(circuit, now)
+            calls = len(circuit.calls)
+            failures = sum(1 for _, ok in circuit.calls if not ok)
+            if calls >= self.min_calls and failures / calls >= (
+                self.failure_rate
+            ):
+                self._open(circuit, now)
+
+    @contextmanager
+    def guard(self, key: str) -> Iterator[None]:
+        """Allow and record the call performed within the block.
+
+        Works for sync code and for `await`s within async code.
+        """
+        self.allow(key)
+        start = self.clock()
+        try:
+            yield
+        except Exception as exc:
+            self.record(key, not is_failure(exc), self.clock() - start)
+            raise
+        except BaseException:
+            # i.e. a cancelled task, the call didn't complete
+            self._release(key)
+            raise
+        self.record(key, True, self.clock() - start)
+
+    def _release(self, key: str) -> None:
+        with self._lock:
+            circuit = self._circuits[key]
+            if circuit.state is CircuitState.half_open and circuit.trials:
+                circuit.trials -= 1
+
+    def _update(self, circuit: _Circuit) -> None:
+        if (
+            circuit.state is CircuitState.open
+            and self.clock() - circuit.opened_at >= self.reset_timeout
+        ):
+            circuit.state = CircuitState.half_open
+            circuit.trials = 0
+
+    def _open(self, circuit: _Circuit, now: float) -> None:
+        circuit.state = CircuitState.open
+        circuit.opened_at = now
+        circuit.calls.clear()
+
+    def _evict(self, circuit: _Circuit, now: float) -> None:
+        while circuit.calls and circuit.calls[0][0] < now - self.window:
+            circuit.calls.popleft()
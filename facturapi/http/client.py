@@ -1,12 +1,16 @@
 import os
+import threading
+from contextlib import nullcontext
 from typing import Any, MutableMapping
-from urllib.parse import urljoin
+from urllib.parse import urlencode, urljoin
 
 import httpx
 from httpx import Response
 
 from ..types.exc import FacturapiResponseException
 from ..version import CLIENT_VERSION
+from .breaker import CircuitBreaker, endpoint_key
+from .singleflight import SingleFlight
 
 API_HOST = 'www.facturapi.io/v2'
 FACTURAPI_TIMEOUT = float(os.getenv('FACTURAPI_TIMEOUT', 10.0))
@@ -20,29 +24,75 @@ class Client:
     is going to be set latter, the method `configure()`
     can be used.
 
+    The underlying `httpx.Client` isn't created until the first
+    request, so importing the library doesn't pay for it.
+
     Attributes:
         host (str): Base URL to perform requests.
+        scheme (str): URL scheme used to reach `host`. Defaults
+            to `https`.
         client (httpx.Client): The httpx client used
             to perform requests.
         api_key (str): API KEY for Facturapi
+        breaker (CircuitBreaker): Circuit breaker guarding the
+            requests. Optional.
+        coalesce (bool): If concurrent identical GETs share a
+            single request. Defaults to `True`.
+
+    Args:
+        api_key: Facturapi `API_KEY`. Defaults to the environment
+            variable `FACTURAPI_KEY`.
+        transport: Optional httpx transport, i.e. to route the
+            requests to an in-process stand-in of Facturapi.
+        breaker: Optional circuit breaker to fail fast while
+            Facturapi is failing. It can be shared among clients.
 
     """
 
     host: str = API_HOST
-    client: httpx.Client
+    scheme: str = 'https'
+    coalesce: bool = True
 
-    def __init__(self) -> None:
-        self.client = httpx.Client(timeout=FACTURAPI_TIMEOUT)
-        self.client.headers.update(
+    def __init__(
+        self,
+        api_key: str | None = None,
+        transport: httpx.BaseTransport | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        if api_key is None:
+            api_key = os.getenv('FACTURAPI_KEY', '')
+        self.api_key = api_key
+        self._transport = transport
+        self.breaker = breaker
+        self._flights = SingleFlight()
+        self._client: httpx.Client | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> httpx.Client:
+        """The httpx client, it's created on the first request."""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self._build_client()
+        return self._client
+
+    @client.setter
+    def client(self, client: httpx.Client) -> None:
+        self._client = client
+
+    def _build_client(self) -> httpx.Client:
+        client = httpx.Client(
+            timeout=FACTURAPI_TIMEOUT, transport=self._transport
+        )
+        client.headers.update(
             {
                 'User-Agent': f'facturapi-python/{CLIENT_VERSION}',
                 'Content-Type': 'application/json',
             }
         )
-
-        # Auth
-        self.api_key = os.getenv('FACTURAPI_KEY', '')
-        self.client.auth = httpx.BasicAuth(self.api_key, '')
+        client.auth = httpx.BasicAuth(self.api_key, '')
+        return client
 
     def configure(self, api_key: str) -> None:
         """Configure the http client.
@@ -55,15 +105,33 @@ class Client:
 
         """
         self.api_key = api_key
-        self.client.auth = httpx.BasicAuth(self.api_key, '')
+        if self._client is not None:
+            self._client.auth = httpx.BasicAuth(self.api_key, '')
+
+    def close(self) -> None:
+        """Close the connection pool of the http client."""
+        if self._client is not None:
+            self._client.close()
 
     def get(
         self,
         endpoint: str,
         params: bytes | MutableMapping[str, str] | None = None,
     ) -> dict[str, Any]:
-        """Performs GET request to Facturapi."""
-        return self.request('get', endpoint, params=params)
+        """Performs GET request to Facturapi.
+
+        Concurrent GETs, from threads or asyncio tasks, to the same
+        endpoint and params share a single request and its parsed
+        response, which must be treated as read-only. Set `coalesce`
+        to `False` to disable it.
+
+        """
+        if not self.coalesce:
+            return self.request('get', endpoint, params=params)
+        return self._flights.do(
+            _flight_key(endpoint, params),
+            lambda: self.request('get', endpoint, params=params),
+        )
 
     def post(self, endpoint: str, data: dict[str, Any]) -> dict[str, Any]:
         """Performs POST request to Facturapi."""
@@ -103,16 +171,13 @@ class Client:
         Raises:
             FacturapiResponseException: If response is not
                 successful.
+            CircuitOpenError: If a `breaker` is set and the
+                endpoint's circuit is open.
 
         """
-        response = self.client.request(
-            method=method,
-            url=('https://' + self.host + urljoin('/', endpoint)),
-            json=data,
-            params=params,
-            **kwargs,
+        response = self._send(
+            method, endpoint, json=data, params=params, **kwargs
         )
-        self._check_response(response)
         return response.json()
 
     def download_request(
@@ -132,16 +197,29 @@ class Client:
         Raises:
             FacturapiResponseException: If response is not
                 successful.
+            CircuitOpenError: If a `breaker` is set and the
+                endpoint's circuit is open.
 
         """
-        response = self.client.request(
-            method='GET',
-            url=('https://' + self.host + urljoin('/', endpoint)),
-            **kwargs,
-        )
-        self._check_response(response)
+        response = self._send('GET', endpoint, **kwargs)
         return response.content
 
+    def _send(self, method: str, endpoint: str, **kwargs) -> Response:
+        guard = (
+            self.breaker.guard(endpoint_key(method, endpoint))
+            if self.breaker
+            else nullcontext()
+        )
+        with guard:
+            response = self.client.request(
+                method=method, url=self._url(endpoint), **kwargs
+            )
+            self._check_response(response)
+        return response
+
+    def _url(self, endpoint: str) -> str:
+        return f'{self.scheme}://{self.host}{urljoin("/", endpoint)}'
+
     @staticmethod
     def _check_response(response: Response) -> None:
         if not response.is_success:
@@ -149,3 +227,11 @@ class Client:
                 json=response.json(),
                 status_code=response.status_code,
             )
+
+
+def _flight_key(
+    endpoint: str, params: bytes | MutableMapping[str, str] | None
+) -> str:
+    if params is None or isinstance(params, bytes):
+        return f'{endpoint}?{params!r}'
+    return f'{endpoint}?{urlencode(sorted(params.items()), doseq=True)}'
@@ -0,0 +1,112 @@
+"""Clients per API key.
+
+A process serving many Facturapi organizations can't share a single
+client reconfigured with `configure()`, every in-flight request would
+race the key switch. The `ClientRegistry` keeps one `Client`, with its
+own connection pool, per API key and `using()` selects the client used
+by the resources in the current context (thread or asyncio task).
+"""
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+import httpx
+
+from .breaker import CircuitBreaker
+from .client import Client
+
+MAX_CLIENTS = 1024
+
+active_client: ContextVar[Client | None] = ContextVar(
+    'facturapi_active_client', default=None
+)
+
+
+class ClientRegistry:
+    """Clients keyed by API key.
+
+    Clients are created on first use and the least recently used ones
+    are dropped once `max_clients` is reached. Dropped clients are not
+    closed since they may still be serving requests, their connections
+    are released once they're garbage collected.
+
+    Args:
+        max_clients: Max number of clients to keep.
+        transport: Optional httpx transport for the created clients.
+        breaker: Optional circuit breaker shared by the created clients.
+
+    """
+
+    def __init__(
+        self,
+        max_clients: int = MAX_CLIENTS,
+        transport: httpx.BaseTransport | None = None,
+        breaker: CircuitBreaker | None = None,
+    ) -> None:
+        self.max_clients = max_clients
+        self.transport = transport
+        self.breaker = breaker
+        self._clients: OrderedDict[str, Client] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, api_key: str) -> bool:
+        return api_key in self._clients
+
+    def get(self, api_key: str) -> Client:
+        """Get the client of an API key, creating it if needed."""
+        with self._lock:
+            try:
+                self._clients.move_to_end(api_key)
+                return self._clients[api_key]
+            except KeyError:
+                pass
+            client = Client(
+                api_key=api_key,
+                transport=self.transport,
+                breaker=self.breaker,
+            )
+            self._clients[api_key] = client
+            if len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+            return client
+
+    def close(self) -> None:
+        """Close and forget every client of the registry."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+registry = ClientRegistry()
+
+
+@contextmanager
+def using(api_key: str | Client) -> Iterator[Client]:
+    """Use a client for the requests within the context.
+
+    Every resource method called inside the `with` block, in the same
+    thread or asyncio task, performs its requests with the selected
+    client. Contexts can be nested.
+
+        with facturapi.using('sk_live_org_1'):
+            invoice = facturapi.Invoice.create(request)
+
+    Args:
+        api_key: API key to get a client from `registry` or a client
+            to use directly.
+
+    """
+    client = api_key if isinstance(api_key, Client) else registry.get(api_key)
+    token = active_client.set(client)
+    try:
+        yield client
+    finally:
+        active_client.reset(token)
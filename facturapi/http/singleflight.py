@@ -0,0 +1,79 @@
+"""Single-flight call coalescing.
+
+When many threads or asyncio tasks ask for the same thing at the same
+time, only the first one (the leader) performs the call; the rest wait
+for it and share its result or exception. Nothing is cached, once the
+call finishes the next one starts a new flight.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar('T')
+
+
+class SingleFlight:
+    """Coalesce concurrent calls by key.
+
+    Results are shared among the callers of a flight, so they must be
+    treated as read-only.
+
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Call `fn` unless a call with the same key is in flight."""
+        future, leader = self._join(key)
+        if not leader:
+            return future.result()
+        try:
+            result = fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            self._leave(key)
+        future.set_result(result)
+        return result
+
+    async def do_async(
+        self, key: Hashable, fn: Callable[[], Awaitable[T]]
+    ) -> T:
+        """Await `fn()` unless a call with the same key is in flight.
+
+        Flights are shared with the calls made through `do()`, an
+        asyncio task can wait for a thread's call and vice versa.
+        """
+        future, leader = self._join(key)
+        if not leader:
+            return await asyncio.wrap_future(future)
+        try:
+            result = await fn()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            self._leave(key)
+        future.set_result(result)
+        return result
+
+    def _join(self, key: Hashable) -> tuple[Future, bool]:
+        with self._lock:
+            try:
+                return self._flights[key], False
+            except KeyError:
+                future: Future[Any] = Future()
+                self._flights[key] = future
+                return future, True
+
+    def _leave(self, key: Hashable) -> None:
+        with self._lock:
+            del self._flights[key]
@@ -5,23 +5,28 @@ the resources can inherit behaviour from these classes to
 perform requests and actions to the API.
 """
 
+import datetime as dt
 from dataclasses import asdict, fields
 from typing import Any, ClassVar, Generator
 from urllib.parse import urlencode
 
+from pydantic import ConfigDict
 from pydantic.dataclasses import dataclass
 
-from ..http import client
+from ..http import Client, get_client
 from ..types import BaseQuery, FileType
 from ..types.exc import MultipleResultsFound, NoResultFound
 from ..types.general import SanitizedDict
+from .scan import MAX_PAGES_PER_WINDOW, DateWindow, scan
 
 
-@dataclass
+@dataclass(config=ConfigDict(defer_build=True))
 class Resource:
     """Generic resource from Facturapi.
 
-    Generic Resource class used by Facturapi resources.
+    Generic Resource class used by Facturapi resources. Its
+    validation schema, and the one of its subclasses, is built
+    on first use instead of on import.
 
     Attributes:
         _resource (ClassVar[str]): Name of the resource the
@@ -41,6 +46,9 @@ class Resource:
 
     @classmethod
     def _from_dict(cls, obj_dict: dict[str, Any]) -> 'Resource':
+        # responses may be shared among coalesced requests, so they're
+        # copied instead of modified in place
+        obj_dict = dict(obj_dict)
         cls._filter_excess_fields(obj_dict)
         return cls(**obj_dict)
 
@@ -87,7 +95,7 @@ class Retrievable(Resource):
             Resource: The resource retrieved.
 
         """
-        response = client.get(f'/{cls._resource}/{id}')
+        response = get_client().get(f'/{cls._resource}/{id}')
         return cls._from_dict(response)
 
     def refresh(self) -> None:
@@ -128,7 +136,7 @@ class Downloadable(Resource):
             bytes: Bytes of the file.
 
         """
-        return client.download_request(
+        return get_client().download_request(
             f'/{cls._resource}/{id}/{file_type.value}'
         )
 
@@ -153,7 +161,7 @@ class Creatable(Resource):
             Resource: The created resource.
 
         """
-        response = client.post(cls._resource, data)
+        response = get_client().post(cls._resource, data)
         return cls._from_dict(response)
 
 
@@ -177,7 +185,7 @@ class Updatable(Resource):
             Resource: The updated resource.
 
         """
-        response = client.put(f'/{cls._resource}/{id}', data)
+        response = get_client().put(f'/{cls._resource}/{id}', data)
         return cls._from_dict(response)
 
 
@@ -205,7 +213,7 @@ class Deletable(Resource):
 
         """
         q = cls._query_params(**query_params)
-        response = client.delete(
+        response = get_client().delete(
             f'/{cls._resource}/{id}?{urlencode(q.dict())}'
         )
         return cls._from_dict(response)
@@ -246,7 +254,7 @@ class Queryable(Resource):
 
         """
         q = cls._query_params(limit=2, **query_params)
-        response = client.get(cls._resource, q.dict())
+        response = get_client().get(cls._resource, q.dict())
         items = response['data']
         len_items = len(items)
         if not len_items:
@@ -268,7 +276,7 @@ class Queryable(Resource):
 
         """
         q = cls._query_params(limit=1, **query_params)
-        response = client.get(cls._resource, q.dict())
+        response = get_client().get(cls._resource, q.dict())
         try:
             item = response['data'][0]
         except IndexError:
@@ -289,7 +297,7 @@ class Queryable(Resource):
 
         """
         q = cls._query_params(**query_params)
-        response = client.get(cls._resource, q.dict())
+        response = get_client().get(cls._resource, q.dict())
         items = response['data']
         return len(items)
 
@@ -304,18 +312,75 @@ class Queryable(Resource):
         Args:
             **query_params (dict): Arbitrary query keyword arguments.
 
+        The client is bound when `all` is called, so the pages are
+        fetched with the client selected by `using()` at that moment
+        even if the generator is consumed outside of its context.
+
         Returns:
             Generator: A generator containing the queried results.
 
         """
         q = cls._query_params(**query_params)
-        next_page_uri = f'{cls._resource}?{urlencode(q.dict())}'
+        return cls._all(get_client(), q)
+
+    @classmethod
+    def scan(
+        cls,
+        gte: dt.datetime,
+        lt: dt.datetime,
+        shards: int = 4,
+        max_workers: int | None = None,
+        max_pages: int = MAX_PAGES_PER_WINDOW,
+        **query_params,
+    ) -> Generator[Resource, None, None]:
+        """Retrieve all resources created within a date range in parallel.
+
+        The range `gte <= created_at < lt` is split into `shards`
+        windows that are paginated in parallel threads. Windows with
+        more than `max_pages` pages are split again so deep pages are
+        never requested. Resources are yielded as their windows are
+        completed, so they're not sorted.
+
+        Args:
+            gte: Start of the range, inclusive.
+            lt: End of the range, exclusive.
+            shards: Number of windows the range is split into.
+            max_workers: Number of threads. Defaults to `shards`.
+            max_pages: Max number of pages to paginate in a window.
+            **query_params (dict): Arbitrary query keyword arguments.
+
+        Returns:
+            Generator: A generator containing the queried results.
+
+        """
+        return scan(
+            cls,
+            get_client(),
+            DateWindow(gte, lt),
+            shards,
+            max_workers=max_workers,
+            max_pages=max_pages,
+            **query_params,
+        )
+
+    @classmethod
+    def _all(
+        cls, client: Client, q: BaseQuery
+    ) -> Generator[Resource, None, None]:
+        for page in cls._pages(client, q):
+            yield from (cls._from_dict(item) for item in page['data'])
+
+    @classmethod
+    def _pages(
+        cls, client: Client, q: BaseQuery
+    ) -> Generator[dict[str, Any], None, None]:
+        next_page_uri = f'{cls._resource}?{urlencode(q.params())}'
         current_page = 1
         while next_page_uri:
             page = client.get(next_page_uri)
-            yield from (cls._from_dict(item) for item in page['data'])
+            yield page
             next_page_uri = ''
             if current_page < page['total_pages']:
                 current_page += 1
                 q.page = current_page
-                next_page_uri = f'{cls._resource}?{urlencode(q.dict())}'
+                next_page_uri = f'{cls._resource}?{urlencode(q.params())}'
@@ -0,0 +1,106 @@
+"""Batch validation of requests.
+
+Validating thousands of requests one by one means one pydantic call per
+request plus one `model_dump` per request when it's created. `validate_many`
+validates the whole batch and serializes the valid requests into payloads
+with a single cached `TypeAdapter`, reporting the errors by index.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Iterable, TypeVar
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import ErrorDetails
+
+from ..types.general import FacturapiModel
+
+Request = TypeVar('Request', bound=FacturapiModel)
+
+
+CHUNK_SIZE = 1_000
+
+
+@dataclass
+class BatchValidation:
+    """Result of validating a batch of requests.
+
+    Attributes:
+        payloads: JSON payload of each valid request, by index, as
+            `create` would send it.
+        errors: Validation errors of each invalid request, by index.
+            Error locations are relative to the request.
+
+    """
+
+    payloads: dict[int, dict[str, Any]] = field(default_factory=dict)
+    errors: dict[int, list[ErrorDetails]] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        """If every request of the batch is valid."""
+        return not self.errors
+
+
+@lru_cache
+def list_adapter(model: type[Request]) -> TypeAdapter[list[Request]]:
+    """Cached `TypeAdapter` for a list of `model`."""
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def validate_many(
+    model: type[Request],
+    rows: Iterable[Any],
+    chunk_size: int = CHUNK_SIZE,
+) -> BatchValidation:
+    """Validate a batch of requests at once.
+
+    Rows are validated and serialized `chunk_size` at a time, so only
+    the payloads, and not the validated models, are kept in memory.
+
+    Args:
+        model: Request model, i.e. `InvoiceRequest`.
+        rows: Raw dicts (or model instances) to validate.
+        chunk_size: Number of rows validated per call to pydantic.
+
+    Returns:
+        BatchValidation: The payloads of the valid requests, ready to
+            be sent with `Invoice.create`, and the errors by index.
+
+    """
+    adapter = list_adapter(model)
+    result = BatchValidation()
+    rows = iter(rows)
+    offset = 0
+    while chunk := list(islice(rows, chunk_size)):
+        _validate_chunk(adapter, chunk, offset, result)
+        offset += len(chunk)
+    return result
+
+
+def _validate_chunk(
+    adapter: TypeAdapter[list[Request]],
+    rows: list[Any],
+    offset: int,
+    result: BatchValidation,
+) -> None:
+    indexes = list(range(len(rows)))
+    try:
+        requests = adapter.validate_python(rows)
+    except ValidationError as exc:
+        errors: defaultdict[int, list[ErrorDetails]] = defaultdict(list)
+        for error in exc.errors():
+            index, *loc = error['loc']
+            error['loc'] = tuple(loc)
+            errors[int(index)].append(error)
+        result.errors.update((offset + i, e) for i, e in errors.items())
+        indexes = [i for i in indexes if i not in errors]
+        # the remaining rows are known to be valid
+        requests = adapter.validate_python([rows[i] for i in indexes])
+
+    payloads = adapter.dump_python(
+        requests, mode='json', exclude_unset=True, exclude_none=True
+    )
+    result.payloads.update(zip((offset + i for i in indexes), payloads))
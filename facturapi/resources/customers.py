@@ -7,15 +7,14 @@ classes to create and update the resource.
 import datetime as dt
 from typing import ClassVar, cast
 
-from pydantic import BaseModel
 from pydantic.dataclasses import dataclass
 
 from ..types.enums import TaxSystemType
-from ..types.general import CustomerAddress
+from ..types.general import CustomerAddress, FacturapiModel
 from .base import Creatable, Queryable, Retrievable, Updatable
 
 
-class CustomerRequest(BaseModel):
+class CustomerRequest(FacturapiModel):
     """
     This request must be filled to `create` a Customer.
     It contains all information necessary to create this resource.
@@ -38,7 +37,7 @@ class CustomerRequest(BaseModel):
     address: CustomerAddress
 
 
-class CustomerUpdateRequest(BaseModel):
+class CustomerUpdateRequest(FacturapiModel):
     """
     This request must be filled to `update` a Customer.
     It contains all information necessary to update this resource.
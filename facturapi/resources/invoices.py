@@ -6,15 +6,15 @@ Invoice Item.
 """
 
 import datetime as dt
-from typing import ClassVar, cast
+from typing import Any, ClassVar, cast
 
-from pydantic import BaseModel
 from pydantic.dataclasses import dataclass
 
-from ..http import client
+from ..http import get_client
 from ..types import InvoiceRelation, InvoiceUse, PaymentForm, PaymentMethod
 from ..types.general import (
     CustomerBasicInfo,
+    FacturapiModel,
     ItemPart,
     Namespace,
     ProductBasicInfo,
@@ -25,7 +25,7 @@ from .customers import Customer, CustomerRequest
 from .resources import retrieve_property
 
 
-class InvoiceItem(BaseModel):
+class InvoiceItem(FacturapiModel):
     """
     Class representing an Item from an Invoice.
 
@@ -57,7 +57,7 @@ class InvoiceItem(BaseModel):
     property_tax_account: str | None = None
 
 
-class InvoiceRequest(BaseModel):
+class InvoiceRequest(FacturapiModel):
     """
     This request must be filled to `create` an Invoice.
     It contains all information necessary to create this resource.
@@ -164,17 +164,24 @@ class Invoice(Creatable, Deletable, Downloadable, Queryable, Retrievable):
     relation: InvoiceRelation | None = None
 
     @classmethod
-    def create(cls, data: InvoiceRequest) -> 'Invoice':
+    def create(cls, data: InvoiceRequest | dict[str, Any]) -> 'Invoice':
         """Create an invoice.
 
         Args:
-            data: All the request data to create an invoice.
+            data: All the request data to create an invoice, or the
+                payload of a request already validated with
+                `validate_many`.
 
         Returns:
             Invoice: The created resource.
 
         """
-        cleaned_data = data.model_dump(exclude_unset=True, exclude_none=True)
+        if isinstance(data, dict):
+            cleaned_data = data
+        else:
+            cleaned_data = data.model_dump(
+                exclude_unset=True, exclude_none=True
+            )
         return cast('Invoice', cls._create(**cleaned_data))
 
     @classmethod
@@ -221,7 +228,7 @@ class Invoice(Creatable, Deletable, Downloadable, Queryable, Retrievable):
         payload = {}
         if recipients:
             payload["email"] = recipients
-        response = client.post(endpoint, payload)
+        response = get_client().post(endpoint, payload)
         return response.get("ok", False)
 
     @property
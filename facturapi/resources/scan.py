@@ -0,0 +1,122 @@
+"""Date sharded scans.
+
+Deep pages are slow to serve and a single `all()` only uses one
+connection. A scan splits a date range into half-open windows
+(`gte <= created_at < lt`) that are paginated independently and in
+parallel. Windows with more than `max_pages` pages are split again, so
+no window is paginated deeply. Since the windows don't overlap, merging
+their results neither duplicates nor misses resources.
+
+The windows are plain values, so they can also be distributed to other
+processes or nodes and scanned there with
+`Queryable.all(date=window.date_filter(), ...)`.
+"""
+
+import datetime as dt
+import math
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from typing import TYPE_CHECKING, Any, Generator, NamedTuple
+
+from ..types import DateFilter
+
+if TYPE_CHECKING:  # pragma: no cover
+    from ..http import Client
+    from .base import Queryable, Resource
+
+MAX_PAGES_PER_WINDOW = 10
+MAX_SPLITS = 16
+MIN_WINDOW = dt.timedelta(seconds=1)
+
+
+class DateWindow(NamedTuple):
+    """Half-open date range, `gte <= date < lt`."""
+
+    gte: dt.datetime
+    lt: dt.datetime
+
+    def split(self, parts: int) -> list['DateWindow']:
+        """Split the window into contiguous windows of the same span."""
+        span = self.lt - self.gte
+        bounds = [self.gte + span * i / parts for i in range(parts)]
+        bounds.append(self.lt)
+        return [
+            DateWindow(gte, lt)
+            for gte, lt in zip(bounds, bounds[1:])
+            if gte < lt
+        ]
+
+    def date_filter(self) -> DateFilter:
+        return DateFilter(gte=self.gte, lt=self.lt)
+
+
+def scan(
+    resource_cls: type['Queryable'],
+    client: 'Client',
+    window: DateWindow,
+    shards: int,
+    max_workers: int | None = None,
+    max_pages: int = MAX_PAGES_PER_WINDOW,
+    min_window: dt.timedelta = MIN_WINDOW,
+    **query_params: Any,
+) -> Generator['Resource', None, None]:
+    """Scan a date window in parallel. Check out `Queryable.scan`."""
+    pool = ThreadPoolExecutor(max_workers or shards)
+
+    def submit(window: DateWindow) -> Future:
+        return pool.submit(
+            _scan_window,
+            resource_cls,
+            client,
+            window,
+            max_pages,
+            min_window,
+            query_params,
+        )
+
+    pending = {submit(w) for w in window.split(shards)}
+    seen: set[str] = set()
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                resources, windows = future.result()
+                pending |= {submit(w) for w in windows}
+                for resource in resources:
+                    if resource.id not in seen:
+                        seen.add(resource.id)
+                        yield resource
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def _scan_window(
+    resource_cls: type['Queryable'],
+    client: 'Client',
+    window: DateWindow,
+    max_pages: int,
+    min_window: dt.timedelta,
+    query_params: dict[str, Any],
+) -> tuple[list['Resource'], list[DateWindow]]:
+    """Paginate a window or split it if it's too dense.
+
+    Returns the resources found or the windows to scan instead.
+
+    """
+    q = resource_cls._query_params(date=window.date_filter(), **query_params)
+    pages = resource_cls._pages(client, q)
+    page = next(pages)
+    total_pages = page['total_pages']
+    if total_pages > max_pages and window.lt - window.gte > min_window:
+        pages.close()
+        parts = min(math.ceil(total_pages / max_pages), MAX_SPLITS)
+        return [], window.split(max(parts, 2))
+
+    resources = [resource_cls._from_dict(item) for item in page['data']]
+    for page in pages:
+        resources.extend(resource_cls._from_dict(i) for i in page['data'])
+    return resources, []
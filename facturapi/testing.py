@@ -0,0 +1,498 @@
+"""In-process stand-in for Facturapi.
+
+`FakeFacturapi` implements the `customers` and `invoices` endpoints used by
+this library on top of an in-memory store. It can be mounted as an httpx
+transport (`FakeFacturapi.patch`) or served over HTTP on a local port
+(`FakeFacturapi.serve`) to load and concurrency test an integration without
+reaching the real API. Latency, server errors and rate limiting (429) can be
+injected to exercise the client under adverse conditions.
+"""
+
+import base64
+import datetime as dt
+import io
+import json
+import random
+import re
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Iterator
+
+import httpx
+
+from .http.client import Client
+
+API_PREFIX = '/v2'
+PAGE_SIZE = 50
+ROUTE_RE = re.compile(
+    r'^/(?P<resource>customers|invoices)'
+    r'(?:/(?P<id>[^/]+)(?:/(?P<action>email|pdf|xml|zip))?)?$'
+)
+DATE_FILTER_RE = re.compile(r'^date\[(?P<op>gte|gt|lte|lt)\]$')
+DATE_OPS: dict[str, Callable[[dt.datetime, dt.datetime], bool]] = dict(
+    gt=lambda value, limit: value > limit,
+    gte=lambda value, limit: value >= limit,
+    lt=lambda value, limit: value < limit,
+    lte=lambda value, limit: value <= limit,
+)
+PDF_DOCUMENT = b'%PDF-1.4\n%fake facturapi document\n%%EOF\n'
+CFDI_TEMPLATE = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    '<cfdi:Comprobante xmlns:cfdi="http://www.sat.gob.mx/cfd/4" '
+    'xmlns:tfd="http://www.sat.gob.mx/TimbreFiscalDigital" Version="4.0" '
+    'Serie="{series}" Folio="{folio_number}" Fecha="{date}" '
+    'FormaPago="{payment_form}" SubTotal="{subtotal:.2f}" '
+    'Moneda="{currency}" Total="{total:.2f}" TipoDeComprobante="I" '
+    'MetodoPago="{payment_method}">'
+    '<cfdi:Emisor Rfc="EKU9003173C9" Nombre="ESCUELA KEMPER URGATE" '
+    'RegimenFiscal="601"/>'
+    '<cfdi:Receptor Rfc="{tax_id}" Nombre="{legal_name}" UsoCFDI="{use}"/>'
+    '<cfdi:Conceptos>{concepts}</cfdi:Conceptos>'
+    '<cfdi:Impuestos TotalImpuestosTrasladados="{taxes:.2f}"/>'
+    '<cfdi:Complemento><tfd:TimbreFiscalDigital Version="1.1" '
+    'UUID="{uuid}" FechaTimbrado="{date}"/></cfdi:Complemento>'
+    '</cfdi:Comprobante>'
+)
+CFDI_CONCEPT_TEMPLATE = (
+    '<cfdi:Concepto ClaveProdServ="{product_key}" Cantidad="{quantity}" '
+    'Descripcion="{description}" ValorUnitario="{price:.2f}" '
+    'Importe="{amount:.2f}"/>'
+)
+IVA_RATE = 0.16
+
+
+def _now() -> str:
+    return dt.datetime.now(dt.timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+def _parse_date(value: str) -> dt.datetime:
+    date = dt.datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if not date.tzinfo:
+        date = date.replace(tzinfo=dt.timezone.utc)
+    return date
+
+
+def _escape(value: Any) -> str:
+    return (
+        str(value)
+        .replace('&', '&amp;')
+        .replace('<', '&lt;')
+        .replace('"', '&quot;')
+    )
+
+
+class FakeFacturapi:
+    """In-memory stand-in of the Facturapi API.
+
+    Attributes:
+        customers (dict[str, dict]): Stored customers by ID.
+        invoices (dict[str, dict]): Stored invoices by ID.
+        requests (int): Number of requests handled.
+
+    Args:
+        latency: Seconds to wait before answering each request.
+        jitter: Extra random seconds, between `0` and `jitter`, added
+            to `latency`.
+        error_rate: Probability of answering with a `500` error.
+        rate_limit_rate: Probability of answering with a `429` error.
+        retry_after: Value of the `Retry-After` header on `429`s.
+        seed: Seed for the random generator, to replay injections
+            and generated IDs.
+
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        retry_after: int = 1,
+        seed: int | None = None,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.retry_after = retry_after
+        self.customers: dict[str, dict[str, Any]] = {}
+        self.invoices: dict[str, dict[str, Any]] = {}
+        self.requests = 0
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @property
+    def transport(self) -> httpx.MockTransport:
+        """httpx transport answering every request with this fake."""
+        return httpx.MockTransport(self.handle)
+
+    @contextmanager
+    def patch(self, client: Client) -> Iterator[Client]:
+        """Route every request of `client` to this fake.
+
+        Args:
+            client: The client to patch, i.e. `facturapi.http.client`.
+
+        """
+        original = client.client
+        client.client = httpx.Client(
+            transport=self.transport,
+            headers=original.headers,
+            auth=original.auth,
+            timeout=original.timeout,
+        )
+        try:
+            yield client
+        finally:
+            client.client.close()
+            client.client = original
+
+    @contextmanager
+    def serve(self, host: str = '127.0.0.1', port: int = 0) -> Iterator[str]:
+        """Serve this fake over HTTP in a background thread.
+
+        Yields the address to assign to `Client.host`, the client's
+        `scheme` must be set to `http`.
+
+        Args:
+            host: Interface to listen on.
+            port: Port to listen on, `0` picks a free one.
+
+        """
+        fake = self
+
+        class Handler(_RequestHandler):
+            handler = staticmethod(fake.handle)
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        server.daemon_threads = True
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            yield f'{host}:{server.server_address[1]}{API_PREFIX}'
+        finally:
+            server.shutdown()
+            server.server_close()
+            thread.join()
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """Answer an httpx request as Facturapi would."""
+        with self._lock:
+            self.requests += 1
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            rate_limited = self._random.random() < self.rate_limit_rate
+            failed = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if rate_limited:
+            return httpx.Response(
+                429,
+                json=dict(message='Too many requests'),
+                headers={'Retry-After': str(self.retry_after)},
+            )
+        if failed:
+            return httpx.Response(500, json=dict(message='Injected error'))
+        if not _api_key(request):
+            return httpx.Response(401, json=dict(message='API key is missing'))
+
+        path = request.url.path
+        if path.startswith(API_PREFIX):
+            path = path.removeprefix(API_PREFIX)
+        match = ROUTE_RE.match(path)
+        if not match:
+            return self._not_found(path)
+        resource, id_, action = match.groups()
+        if action == 'email':
+            suffix = '_email'
+        elif action:
+            suffix = '_file'
+        else:
+            suffix = '_item' if id_ else ''
+        route = getattr(
+            self, f'_{request.method.lower()}_{resource}{suffix}', None
+        )
+        if route is None:
+            return httpx.Response(405, json=dict(message='Method not allowed'))
+        try:
+            return route(request, id_, action)
+        except KeyError as exc:
+            missing = exc.args[0]
+            return self._not_found(
+                missing, resource if missing == id_ else 'customers'
+            )
+        except (TypeError, ValueError) as exc:
+            return httpx.Response(400, json=dict(message=str(exc)))
+
+    def create_customer(
+        self, data: dict[str, Any], created_at: str | None = None
+    ) -> dict[str, Any]:
+        """Store a customer given its request data."""
+        for required in ('legal_name', 'tax_id'):
+            if not data.get(required):
+                raise ValueError(f'"{required}" is required')
+        customer = dict(
+            id=self._new_id(),
+            created_at=created_at or _now(),
+            livemode=False,
+            legal_name=data['legal_name'],
+            tax_id=data['tax_id'],
+            tax_system=data.get('tax_system'),
+            email=data.get('email', ''),
+            phone=data.get('phone'),
+            address=data.get('address', {}),
+        )
+        with self._lock:
+            self.customers[customer['id']] = customer
+        return customer
+
+    def create_invoice(
+        self, data: dict[str, Any], created_at: str | None = None
+    ) -> dict[str, Any]:
+        """Store an invoice given its request data."""
+        customer_data = data.get('customer')
+        if isinstance(customer_data, str):
+            customer = self.customers[customer_data]
+        elif isinstance(customer_data, dict):
+            customer = self.create_customer(customer_data)
+        else:
+            raise ValueError('"customer" is required')
+        if not data.get('items'):
+            raise ValueError('"items" is required')
+
+        items = []
+        for item in data['items']:
+            product = item['product']
+            if isinstance(product, str):
+                raise ValueError(f'Product "{product}" does not exist')
+            items.append(
+                dict(
+                    quantity=item.get('quantity', 1),
+                    discount=item.get('discount', 0),
+                    product=dict(
+                        description=product.get('description', ''),
+                        product_key=product.get('product_key', ''),
+                        price=float(product.get('price', 0)),
+                        unit_key='H87',
+                        unit_name='Pieza',
+                        tax_included=True,
+                    ),
+                    parts=item.get('parts'),
+                )
+            )
+        total = sum(
+            item['quantity'] * item['product']['price'] for item in items
+        )
+        with self._lock:
+            folio_number = len(self.invoices) + 1
+        invoice = dict(
+            id=self._new_id(),
+            created_at=created_at or _now(),
+            livemode=False,
+            status='valid',
+            type='I',
+            cancellation_status='none',
+            customer=dict(
+                id=customer['id'],
+                legal_name=customer['legal_name'],
+                tax_id=customer['tax_id'],
+            ),
+            total=round(total, 2),
+            uuid=self._new_uuid(),
+            use=data.get('use', 'G01'),
+            folio_number=data.get('folio_number', folio_number),
+            series=data.get('series'),
+            payment_form=data['payment_form'],
+            payment_method=data.get('payment_method', 'PUE'),
+            currency=data.get('currency', 'MXN'),
+            exchange=data.get('exchange', 1),
+            items=items,
+            related=data.get('related'),
+            relation=data.get('relation'),
+        )
+        with self._lock:
+            self.invoices[invoice['id']] = invoice
+        return invoice
+
+    def render_xml(self, invoice: dict[str, Any]) -> bytes:
+        """CFDI 4.0 XML of a stored invoice."""
+        concepts = ''.join(
+            CFDI_CONCEPT_TEMPLATE.format(
+                product_key=item['product']['product_key'],
+                quantity=item['quantity'],
+                description=_escape(item['product']['description']),
+                price=item['product']['price'],
+                amount=item['quantity'] * item['product']['price'],
+            )
+            for item in invoice['items']
+        )
+        subtotal = invoice['total'] / (1 + IVA_RATE)
+        return CFDI_TEMPLATE.format(
+            series=_escape(invoice['series'] or ''),
+            folio_number=invoice['folio_number'],
+            date=invoice['created_at'].replace('Z', '')[:19],
+            payment_form=invoice['payment_form'],
+            payment_method=invoice['payment_method'],
+            subtotal=subtotal,
+            currency=invoice['currency'],
+            total=invoice['total'],
+            tax_id=invoice['customer']['tax_id'],
+            legal_name=_escape(invoice['customer']['legal_name']),
+            use=invoice['use'],
+            concepts=concepts,
+            taxes=invoice['total'] - subtotal,
+            uuid=invoice['uuid'],
+        ).encode()
+
+    # Routes
+
+    def _post_customers(self, request: httpx.Request, *_) -> httpx.Response:
+        return httpx.Response(200, json=self.create_customer(_json(request)))
+
+    def _post_invoices(self, request: httpx.Request, *_) -> httpx.Response:
+        return httpx.Response(200, json=self.create_invoice(_json(request)))
+
+    def _get_customers(self, request: httpx.Request, *_) -> httpx.Response:
+        return self._list(request, self.customers)
+
+    def _get_invoices(self, request: httpx.Request, *_) -> httpx.Response:
+        return self._list(request, self.invoices)
+
+    def _get_customers_item(self, _, id_: str, *__) -> httpx.Response:
+        return httpx.Response(200, json=self.customers[id_])
+
+    def _get_invoices_item(self, _, id_: str, *__) -> httpx.Response:
+        return httpx.Response(200, json=self.invoices[id_])
+
+    def _put_customers_item(
+        self, request: httpx.Request, id_: str, *_
+    ) -> httpx.Response:
+        with self._lock:
+            customer = self.customers[id_]
+            customer.update(_json(request))
+        return httpx.Response(200, json=customer)
+
+    def _delete_invoices_item(
+        self, request: httpx.Request, id_: str, *_
+    ) -> httpx.Response:
+        if not request.url.params.get('motive'):
+            raise ValueError('"motive" is required')
+        with self._lock:
+            invoice = self.invoices[id_]
+            invoice.update(status='canceled', cancellation_status='accepted')
+        return httpx.Response(200, json=invoice)
+
+    def _post_invoices_email(
+        self, request: httpx.Request, id_: str, *_
+    ) -> httpx.Response:
+        if id_ not in self.invoices:
+            return self._not_found(id_, 'invoices')
+        return httpx.Response(200, json=dict(ok=True))
+
+    def _get_invoices_file(
+        self, _, id_: str, file_type: str
+    ) -> httpx.Response:
+        invoice = self.invoices[id_]
+        xml = self.render_xml(invoice)
+        if file_type == 'pdf':
+            return httpx.Response(200, content=PDF_DOCUMENT)
+        if file_type == 'xml':
+            return httpx.Response(200, content=xml)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(f'{id_}.pdf', PDF_DOCUMENT)
+            archive.writestr(f'{id_}.xml', xml)
+        return httpx.Response(200, content=buffer.getvalue())
+
+    # Helpers
+
+    def _list(
+        self, request: httpx.Request, store: dict[str, dict[str, Any]]
+    ) -> httpx.Response:
+        params = request.url.params
+        limit = int(params.get('limit', PAGE_SIZE))
+        page = int(params.get('page', 1))
+        q = params.get('q', '').lower()
+        filters = []
+        for key, value in params.multi_items():
+            if m := DATE_FILTER_RE.match(key):
+                filters.append((DATE_OPS[m.group('op')], _parse_date(value)))
+        with self._lock:
+            objects = list(store.values())
+        results = [
+            obj
+            for obj in reversed(objects)
+            if (not q or q in json.dumps(obj).lower())
+            and all(
+                op(_parse_date(obj['created_at']), limit_)
+                for op, limit_ in filters
+            )
+        ]
+        total_pages = max(1, -(-len(results) // limit))
+        return httpx.Response(
+            200,
+            json=dict(
+                page=page,
+                total_pages=total_pages,
+                total_results=len(results),
+                data=results[slice((page - 1) * limit, page * limit)],
+            ),
+        )
+
+    def _new_id(self) -> str:
+        with self._lock:
+            return f'{self._random.getrandbits(96):024x}'
+
+    def _new_uuid(self) -> str:
+        with self._lock:
+            value = f'{self._random.getrandbits(128):032x}'
+        return '-'.join(
+            (value[:8], value[8:12], value[12:16], value[16:20], value[20:])
+        )
+
+    @staticmethod
+    def _not_found(id_: str, resource: str | None = None) -> httpx.Response:
+        name = resource[:-1].capitalize() if resource else 'Resource'
+        return httpx.Response(
+            404, json=dict(message=f'{name} with Id "{id_}" was not found')
+        )
+
+
+def _api_key(request: httpx.Request) -> str:
+    _, _, credentials = request.headers.get('Authorization', '').partition(' ')
+    try:
+        return base64.b64decode(credentials).decode().partition(':')[0]
+    except ValueError:
+        return ''
+
+
+def _json(request: httpx.Request) -> dict[str, Any]:
+    return json.loads(request.content or b'{}')
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True
+    handler: Callable[[httpx.Request], httpx.Response]
+
+    def _dispatch(self) -> None:
+        length = int(self.headers.get('Content-Length') or 0)
+        request = httpx.Request(
+            self.command,
+            f'http://{self.headers.get("Host", "localhost")}{self.path}',
+            headers=dict(self.headers.items()),
+            content=self.rfile.read(length),
+        )
+        response = self.handler(request)
+        self.send_response(response.status_code)
+        for header, value in response.headers.items():
+            self.send_header(header, value)
+        self.end_headers()
+        self.wfile.write(response.content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _dispatch
+
+    def log_message(self, *_) -> None:
+        pass
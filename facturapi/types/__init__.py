@@ -15,14 +15,48 @@ __all__ = [
     'validators',
 ]
 
-from . import exc, general, validators
-from .enums import (
-    FileType,
-    InvoiceRelation,
-    InvoiceType,
-    InvoiceUse,
-    PaymentForm,
-    PaymentMethod,
-    TaxSystemType,
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from . import exc, general, validators
+    from .enums import (
+        FileType,
+        InvoiceRelation,
+        InvoiceType,
+        InvoiceUse,
+        PaymentForm,
+        PaymentMethod,
+        TaxSystemType,
+    )
+    from .exc import FacturapiResponseException
+    from .general import SanitizedDict
+    from .queries import BaseQuery, DateFilter
+
+# Names are imported from their module on first access, so importing
+# `facturapi.types.exc` doesn't build every model and enum.
+_lazy_attributes = dict(
+    BaseQuery='.queries',
+    DateFilter='.queries',
+    FacturapiResponseException='.exc',
+    FileType='.enums',
+    InvoiceRelation='.enums',
+    InvoiceType='.enums',
+    InvoiceUse='.enums',
+    PaymentForm='.enums',
+    PaymentMethod='.enums',
+    SanitizedDict='.general',
+    TaxSystemType='.enums',
 )
-from .queries import BaseQuery, DateFilter
+_submodules = {'enums', 'exc', 'general', 'queries', 'validators'}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _lazy_attributes:
+        value = getattr(import_module(_lazy_attributes[name], __name__), name)
+    elif name in _submodules:
+        value = import_module(f'.{name}', __name__)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
@@ -21,3 +21,14 @@ class FacturapiResponseException(FacturapiException):
 
     def __str__(self) -> str:
         return repr(self)
+
+
+@dataclass
+class CircuitOpenError(FacturapiException):
+    """Requests to the endpoint are failing fast while Facturapi recovers"""
+
+    endpoint: str
+    retry_after: float
+
+    def __str__(self) -> str:
+        return repr(self)
@@ -1,9 +1,20 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 from .validators import sanitize_dict
 
 
-class CustomerAddress(BaseModel):
+class FacturapiModel(BaseModel):
+    """Base model for the library's requests and nested types.
+
+    The validation schema is built on first use instead of on import,
+    so only the models an application touches pay for it.
+
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class CustomerAddress(FacturapiModel):
     """Address of a customer.
 
     Attributes:
@@ -30,7 +41,7 @@ class CustomerAddress(BaseModel):
     country: str | None = None
 
 
-class CustomerBasicInfo(BaseModel):
+class CustomerBasicInfo(FacturapiModel):
     """Customer's basic info"""
 
     id: str
@@ -38,7 +49,7 @@ class CustomerBasicInfo(BaseModel):
     tax_id: str
 
 
-class ItemPart(BaseModel):
+class ItemPart(FacturapiModel):
     """Defines a part of an invoice item."""
 
     description: str
@@ -49,7 +60,7 @@ class ItemPart(BaseModel):
     customs_keys: list[str] | None = None
 
 
-class Namespace(BaseModel):
+class Namespace(FacturapiModel):
     """Namespace for spceial XML namespaces for an invoice."""
 
     prefix: str | None = None
@@ -57,7 +68,7 @@ class Namespace(BaseModel):
     schema_location: str | None = None
 
 
-class ProductBasicInfo(BaseModel):
+class ProductBasicInfo(FacturapiModel):
     """Product's basic info."""
 
     id: str
@@ -1,7 +1,9 @@
 import datetime as dt
 from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from .general import FacturapiModel
 
 MAX_PAGE_SIZE = 50
 MIN_PAGE = 1
@@ -10,7 +12,7 @@ PageSize = Annotated[int, Field(gt=0, le=MAX_PAGE_SIZE)]
 Page = Annotated[int, Field(ge=MIN_PAGE)]
 
 
-class DateFilter(BaseModel):
+class DateFilter(FacturapiModel):
     """Model for a date filter query.
 
     Defines possible filters for date values.
@@ -33,7 +35,7 @@ class DateFilter(BaseModel):
     lte: str | dt.datetime | None = None
 
 
-class BaseQuery(BaseModel):
+class BaseQuery(FacturapiModel):
     """Base query to query for resources.
 
     Defines all the possible arguments to query
@@ -64,6 +66,29 @@ class BaseQuery(BaseModel):
         d = super().model_dump(*args, **kwargs)
         return d
 
+    def params(self) -> list[tuple[str, str]]:
+        """Query string parameters of the query.
+
+        Nested filters are encoded in bracket notation, i.e.
+        `date[gte]=2020-12-01T00:00:00`, as Facturapi expects them.
+
+        """
+        params: list[tuple[str, str]] = []
+        for key, value in self.dict().items():
+            if isinstance(value, dict):
+                params.extend(
+                    (f'{key}[{k}]', _param(v)) for k, v in value.items()
+                )
+            else:
+                params.append((key, _param(value)))
+        return params
+
+
+def _param(value: Any) -> str:
+    if isinstance(value, dt.datetime):
+        return value.isoformat()
+    return str(value)
+
 
 class InvoiceQuery(BaseQuery):
     motive: str | None = None
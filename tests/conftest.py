@@ -1,5 +1,10 @@
+from typing import Generator
+
 import pytest
 
+from facturapi.http import client
+from facturapi.testing import FakeFacturapi
+
 
 @pytest.fixture(scope='module')
 def vcr_config():
@@ -8,3 +13,13 @@ def vcr_config():
         record_mode='once',
     )
     return config
+
+
+@pytest.fixture
+def fake_facturapi() -> Generator[FakeFacturapi, None, None]:
+    fake = FakeFacturapi(seed=0)
+    api_key = client.api_key
+    client.configure('sk_test_fake')
+    with fake.patch(client):
+        yield fake
+    client.configure(api_key)
@@ -0,0 +1,143 @@
+import asyncio
+
+import pytest
+
+from facturapi.http import CircuitBreaker, ClientRegistry
+from facturapi.http.breaker import CircuitState, endpoint_key
+from facturapi.http.client import Client
+from facturapi.testing import FakeFacturapi
+from facturapi.types.exc import CircuitOpenError, FacturapiResponseException
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_endpoint_key():
+    assert (
+        endpoint_key('get', '/invoices/INV01/pdf') == 'GET invoices/{id}/pdf'
+    )
+    assert endpoint_key('get', 'invoices?limit=1') == 'GET invoices'
+    assert endpoint_key('delete', '/invoices/INV01?motive=01') == (
+        'DELETE invoices/{id}'
+    )
+
+
+def test_breaker_opens_and_recovers():
+    clock = Clock()
+    breaker = CircuitBreaker(
+        failure_rate=0.5, min_calls=4, window=10, reset_timeout=5, clock=clock
+    )
+    key = 'GET invoices'
+    for success in (True, False, True):
+        breaker.allow(key)
+        breaker.record(key, success)
+    assert breaker.state(key) is CircuitState.closed
+    breaker.record(key, False)
+    assert breaker.state(key) is CircuitState.open
+    assert breaker.state('GET customers') is CircuitState.closed
+
+    clock.now = 2
+    with pytest.raises(CircuitOpenError) as e:
+        breaker.allow(key)
+    assert e.value.retry_after == 3
+    assert e.value.endpoint == key
+    assert str(e.value)
+    breaker.record(key, False)  # late result of a call in flight
+    assert breaker.state(key) is CircuitState.open
+
+    clock.now = 5
+    assert breaker.state(key) is CircuitState.half_open
+    breaker.allow(key)
+    with pytest.raises(CircuitOpenError):
+        breaker.allow(key)
+    breaker.record(key, False)
+    assert breaker.state(key) is CircuitState.open
+
+    clock.now = 10
+    breaker.allow(key)
+    breaker.record(key, True)
+    assert breaker.state(key) is CircuitState.closed
+
+
+def test_breaker_window_and_latency():
+    clock = Clock()
+    breaker = CircuitBreaker(
+        min_calls=2, window=10, slow_call=1.0, clock=clock
+    )
+    key = 'POST invoices'
+    breaker.record(key, False)
+    clock.now = 20
+    breaker.record(key, True)
+    assert breaker.state(key) is CircuitState.closed
+    breaker.record(key, True, latency=2.0)
+    assert breaker.state(key) is CircuitState.open
+
+
+def test_breaker_guard():
+    clock = Clock()
+    breaker = CircuitBreaker(
+        failure_rate=0.3, min_calls=1, reset_timeout=1, clock=clock
+    )
+    with pytest.raises(FacturapiResponseException):
+        with breaker.guard('GET invoices'):
+            raise FacturapiResponseException(json={}, status_code=404)
+    assert breaker.state('GET invoices') is CircuitState.closed
+    with breaker.guard('GET invoices'):
+        pass
+
+    with pytest.raises(FacturapiResponseException):
+        with breaker.guard('GET invoices'):
+            raise FacturapiResponseException(json={}, status_code=503)
+    assert breaker.state('GET invoices') is CircuitState.open
+
+    clock.now = 1
+    with pytest.raises(KeyboardInterrupt):
+        with breaker.guard('GET invoices'):
+            raise KeyboardInterrupt
+    # the trial call wasn't completed so another one is allowed
+    with breaker.guard('GET invoices'):
+        pass
+    assert breaker.state('GET invoices') is CircuitState.closed
+
+
+def test_breaker_guard_async():
+    breaker = CircuitBreaker(min_calls=1)
+
+    async def call() -> None:
+        with breaker.guard('GET invoices'):
+            await asyncio.sleep(0)
+            raise ConnectionError
+
+    with pytest.raises(ConnectionError):
+        asyncio.run(call())
+    with pytest.raises(CircuitOpenError):
+        asyncio.run(call())
+
+
+def test_client_with_breaker():
+    fake = FakeFacturapi(error_rate=1.0)
+    breaker = CircuitBreaker(min_calls=3)
+    client = Client(
+        api_key='sk_test', transport=fake.transport, breaker=breaker
+    )
+    for _ in range(3):
+        with pytest.raises(FacturapiResponseException):
+            client.get('/invoices')
+    with pytest.raises(CircuitOpenError):
+        client.get('/invoices')
+    with pytest.raises(CircuitOpenError):
+        client.get('/invoices?limit=1')
+    assert fake.requests == 3
+
+    fake.error_rate = 0.0
+    with pytest.raises(FacturapiResponseException):
+        client.download_request('/invoices/unknown/pdf')
+
+    registry = ClientRegistry(transport=fake.transport, breaker=breaker)
+    with pytest.raises(CircuitOpenError):
+        registry.get('sk_test_2').get('/invoices')
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+import facturapi
+from facturapi.http import ClientRegistry, client, get_client, registry
+from facturapi.http.client import Client
+from facturapi.testing import FakeFacturapi
+
+
+def test_registry_clients_by_key():
+    registry = ClientRegistry(max_clients=2)
+    org_1 = registry.get('sk_test_1')
+    assert registry.get('sk_test_1') is org_1
+    assert org_1.api_key == 'sk_test_1'
+    org_2 = registry.get('sk_test_2')
+    assert org_2.client is not org_1.client
+
+    registry.get('sk_test_1')
+    registry.get('sk_test_3')
+    assert len(registry) == 2
+    assert 'sk_test_2' not in registry
+    assert 'sk_test_1' in registry
+
+    registry.close()
+    assert not len(registry)
+    assert org_1.client.is_closed
+
+
+def test_using_selects_client():
+    assert get_client() is client
+    with facturapi.using('sk_test_using') as org_1:
+        assert org_1 is registry.get('sk_test_using')
+        assert get_client() is org_1
+        other = Client(api_key='sk_test_other')
+        with facturapi.using(other):
+            assert get_client() is other
+        assert get_client() is org_1
+    assert get_client() is client
+
+
+def test_using_is_context_local():
+    seen = {}
+    barrier = threading.Barrier(2)
+
+    def worker(api_key: str) -> None:
+        with facturapi.using(api_key):
+            barrier.wait()
+            seen[api_key] = get_client().api_key
+
+    threads = [
+        threading.Thread(target=worker, args=(key,))
+        for key in ('sk_test_a', 'sk_test_b')
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == dict(sk_test_a='sk_test_a', sk_test_b='sk_test_b')
+
+
+def test_resources_honor_using():
+    org_1, org_2 = FakeFacturapi(seed=1), FakeFacturapi(seed=2)
+    registry = ClientRegistry(transport=org_1.transport)
+    client_2 = Client(api_key='sk_test_2', transport=org_2.transport)
+
+    with facturapi.using(registry.get('sk_test_1')):
+        customer = facturapi.Customer.create(
+            facturapi.resources.customers.CustomerRequest(
+                legal_name='Frida Kahlo',
+                tax_id='KAFR070706AAA',
+                tax_system='625',
+                email='frida@kahlo.com',
+                address=dict(zip='04100'),
+            )
+        )
+        customers = facturapi.Customer.all()
+    assert customer.id in org_1.customers
+    assert not org_2.customers
+
+    with facturapi.using(client_2):
+        # bound to the client of the first context
+        assert [c.id for c in customers] == [customer.id]
+        with pytest.raises(facturapi.types.exc.FacturapiResponseException):
+            facturapi.Customer.retrieve(customer.id)
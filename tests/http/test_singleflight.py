@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import facturapi
+from facturapi.http.client import Client
+from facturapi.http.singleflight import SingleFlight
+from facturapi.testing import FakeFacturapi
+
+
+def test_single_flight_threads():
+    flights = SingleFlight()
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    def fetch() -> dict:
+        calls.append(1)
+        started.set()
+        release.wait()
+        return dict(id='CUSTOMER01')
+
+    with ThreadPoolExecutor(5) as pool:
+        leader = pool.submit(flights.do, 'customers/CUSTOMER01', fetch)
+        started.wait()
+        followers = [
+            pool.submit(flights.do, 'customers/CUSTOMER01', fetch)
+            for _ in range(4)
+        ]
+        time.sleep(0.05)
+        release.set()
+        results = [leader.result()] + [f.result() for f in followers]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert not len(flights)
+    assert flights.do('customers/CUSTOMER01', fetch) is not results[0]
+
+
+def test_single_flight_shares_exceptions():
+    flights = SingleFlight()
+    release = threading.Event()
+
+    def fail() -> None:
+        release.wait()
+        raise ConnectionError
+
+    with ThreadPoolExecutor(2) as pool:
+        leader = pool.submit(flights.do, 'key', fail)
+        while not len(flights):
+            time.sleep(0.001)
+        follower = pool.submit(flights.do, 'key', fail)
+        release.set()
+        with pytest.raises(ConnectionError):
+            leader.result()
+        with pytest.raises(ConnectionError):
+            follower.result()
+
+
+def test_single_flight_async():
+    flights = SingleFlight()
+    calls = []
+
+    async def fetch() -> str:
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return 'result'
+
+    async def fail() -> str:
+        await asyncio.sleep(0.01)
+        raise ConnectionError
+
+    async def main() -> None:
+        results = await asyncio.gather(
+            *(flights.do_async('key', fetch) for _ in range(5))
+        )
+        assert results == ['result'] * 5
+        assert len(calls) == 1
+
+        # asyncio tasks join flights started by threads
+        release = threading.Event()
+        thread_flight = asyncio.create_task(
+            asyncio.to_thread(flights.do, 'thread', release.wait)
+        )
+        while not len(flights):
+            await asyncio.sleep(0.001)
+        follower = asyncio.create_task(flights.do_async('thread', fetch))
+        await asyncio.sleep(0.01)
+        release.set()
+        assert await follower is True
+        assert await thread_flight is True
+
+        with pytest.raises(ConnectionError):
+            await flights.do_async('error', fail)
+
+    asyncio.run(main())
+
+
+def test_client_coalesces_gets():
+    fake = FakeFacturapi(latency=0.05)
+    customer = fake.create_customer(
+        dict(legal_name='Remedios Varo', tax_id='VAUR631216M55')
+    )
+    client = Client(api_key='sk_test', transport=fake.transport)
+    barrier = threading.Barrier(8)
+
+    def retrieve(_):
+        barrier.wait()
+        with facturapi.using(client):
+            return facturapi.Customer.retrieve(customer['id'])
+
+    with ThreadPoolExecutor(8) as pool:
+        customers = list(pool.map(retrieve, range(8)))
+    assert fake.requests < 8
+    assert {c.id for c in customers} == {customer['id']}
+
+    client.coalesce = False
+    fake.requests = 0
+    barrier.reset()
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(retrieve, range(8)))
+    assert fake.requests == 8
+
+    client.coalesce = True
+    assert client.get('/customers', dict(q='varo'))['total_results'] == 1
+    assert client.get('/customers', b'q=varo')['total_results'] == 1
@@ -0,0 +1,59 @@
+import facturapi
+from facturapi.resources.batch import list_adapter, validate_many
+from facturapi.resources.invoices import InvoiceRequest
+
+ITEM = dict(
+    product=dict(
+        description='Producto Test',
+        product_key='50202201',
+        price=42.05,
+    ),
+    quantity=2,
+)
+
+
+def test_validate_many():
+    rows = [
+        dict(customer='CUSTOMER01', items=[ITEM], payment_form='03'),
+        dict(customer='CUSTOMER01', items=[ITEM], payment_form='XX'),
+        InvoiceRequest(customer='CUSTOMER02', items=[ITEM], payment_form='04'),
+        dict(items=[dict(quantity='many')], payment_form='03'),
+    ]
+    result = validate_many(InvoiceRequest, iter(rows), chunk_size=3)
+
+    assert not result.ok
+    assert sorted(result.payloads) == [0, 2]
+    assert sorted(result.errors) == [1, 3]
+    assert [e['loc'] for e in result.errors[1]] == [('payment_form',)]
+    assert {e['loc'] for e in result.errors[3]} == {
+        ('customer',),
+        ('items', 0, 'quantity'),
+        ('items', 0, 'product'),
+    }
+    assert result.payloads[0] == InvoiceRequest(**rows[0]).model_dump(
+        mode='json', exclude_unset=True, exclude_none=True
+    )
+    assert result.payloads[2]['customer'] == 'CUSTOMER02'
+    assert list_adapter(InvoiceRequest) is list_adapter(InvoiceRequest)
+
+
+def test_validate_many_all_valid():
+    result = validate_many(
+        InvoiceRequest,
+        [dict(customer='CUSTOMER01', items=[ITEM], payment_form='03')],
+    )
+    assert result.ok
+    assert result.payloads[0]['payment_form'] == '03'
+
+
+def test_create_from_payload(fake_facturapi):
+    customer = fake_facturapi.create_customer(
+        dict(legal_name='Remedios Varo', tax_id='VAUR631216M55')
+    )
+    result = validate_many(
+        InvoiceRequest,
+        [dict(customer=customer['id'], items=[ITEM], payment_form='03')],
+    )
+    invoice = facturapi.Invoice.create(result.payloads[0])
+    assert invoice.id in fake_facturapi.invoices
+    assert invoice.payment_form == '03'
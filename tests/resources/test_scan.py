@@ -0,0 +1,81 @@
+import datetime as dt
+
+import pytest
+
+import facturapi
+from facturapi.resources.scan import DateWindow
+from facturapi.types.exc import FacturapiResponseException
+
+START = dt.datetime(2020, 1, 1, tzinfo=dt.timezone.utc)
+
+
+@pytest.fixture
+def invoices(fake_facturapi) -> list[str]:
+    customer = fake_facturapi.create_customer(
+        dict(legal_name='Remedios Varo', tax_id='VAUR631216M55')
+    )
+    request = dict(
+        customer=customer['id'],
+        items=[dict(product=dict(description='Test', price=10))],
+        payment_form='03',
+    )
+    # dense at the start of the range, sparse afterwards
+    dates = [START + dt.timedelta(minutes=i) for i in range(80)] + [
+        START + dt.timedelta(days=i) for i in range(1, 40)
+    ]
+    invoices = []
+    for date in dates:
+        invoice = fake_facturapi.create_invoice(request, date.isoformat())
+        invoices.append(invoice['id'])
+    return invoices
+
+
+def test_date_window_split():
+    window = DateWindow(START, START + dt.timedelta(days=3))
+    parts = window.split(3)
+    assert parts == [
+        DateWindow(START, START + dt.timedelta(days=1)),
+        DateWindow(START + dt.timedelta(days=1), START + dt.timedelta(days=2)),
+        DateWindow(START + dt.timedelta(days=2), window.lt),
+    ]
+    tiny = DateWindow(START, START + dt.timedelta(microseconds=2))
+    assert len(tiny.split(4)) == 2
+    assert window.date_filter().gte == START
+
+
+def test_scan(fake_facturapi, invoices):
+    end = START + dt.timedelta(days=40)
+    scanned = list(
+        facturapi.Invoice.scan(START, end, shards=4, max_pages=2, limit=10)
+    )
+    assert sorted(i.id for i in scanned) == sorted(invoices)
+
+    # the first shard has the 80 dense invoices so it's split again
+    requests = fake_facturapi.requests
+    assert requests > 4 + len(invoices) // 10
+
+
+def test_scan_with_query(fake_facturapi, invoices):
+    scanned = list(
+        facturapi.Invoice.scan(
+            START,
+            START + dt.timedelta(minutes=10),
+            shards=2,
+            q='remedios',
+        )
+    )
+    assert len(scanned) == 10
+
+
+def test_scan_stops_early(fake_facturapi, invoices):
+    scan = facturapi.Invoice.scan(
+        START, START + dt.timedelta(days=40), shards=8, limit=5
+    )
+    assert next(scan).id in invoices
+    scan.close()
+
+
+def test_scan_errors(fake_facturapi):
+    fake_facturapi.error_rate = 1.0
+    with pytest.raises(FacturapiResponseException):
+        list(facturapi.Invoice.scan(START, START + dt.timedelta(days=1)))
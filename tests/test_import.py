@@ -0,0 +1,45 @@
+import subprocess
+import sys
+
+import pytest
+
+import facturapi
+import facturapi.types
+from facturapi.http.client import Client
+
+
+def test_import_is_lazy():
+    statement = (
+        'import sys, facturapi; '
+        'assert "httpx" not in sys.modules; '
+        'assert "pydantic" not in sys.modules; '
+        'assert "facturapi.resources" not in sys.modules'
+    )
+    subprocess.run([sys.executable, '-c', statement], check=True)
+
+
+def test_lazy_attributes(monkeypatch):
+    assert facturapi.Invoice is facturapi.resources.Invoice
+    assert facturapi.configure == facturapi.http.client.configure
+    assert facturapi.types.BaseQuery.__name__ == 'BaseQuery'
+    monkeypatch.delattr(facturapi, 'types')
+    monkeypatch.delattr(facturapi.types, 'enums')
+    assert facturapi.types.enums.FileType.pdf == 'pdf'
+    with pytest.raises(AttributeError):
+        facturapi.unknown
+    with pytest.raises(AttributeError):
+        facturapi.types.unknown
+
+
+def test_http_client_created_on_first_use():
+    client = Client(api_key='sk_test_lazy')
+    assert client._client is None
+    client.configure('sk_test_lazy_2')
+    client.close()
+    assert client._client is None
+    http_client = client.client
+    assert client.client is http_client
+    client.configure('sk_test_lazy_3')
+    assert http_client.auth is not None
+    client.close()
+    assert http_client.is_closed
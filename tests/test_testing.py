@@ -0,0 +1,185 @@
+import io
+import zipfile
+
+import httpx
+import pytest
+
+import facturapi
+from facturapi.http.client import Client
+from facturapi.resources.customers import CustomerRequest
+from facturapi.resources.invoices import InvoiceRequest
+from facturapi.testing import FakeFacturapi
+from facturapi.types import FileType, PaymentForm, TaxSystemType
+from facturapi.types.exc import FacturapiResponseException
+from facturapi.types.general import CustomerAddress
+
+
+def invoice_request(customer):
+    return InvoiceRequest(
+        customer=customer,
+        items=[
+            dict(
+                product=dict(
+                    description='Producto Test',
+                    product_key='50202201',
+                    price=42.05,
+                ),
+                quantity=2,
+            ),
+        ],
+        payment_form=PaymentForm.tarjeta_de_credito,
+    )
+
+
+CUSTOMER_REQUEST = CustomerRequest(
+    legal_name='Remedios Varo',
+    tax_id='VAUR631216M55',
+    tax_system=TaxSystemType.AE_PLAT_TEC,
+    email='remedios@varo.com',
+    address=CustomerAddress(zip='06700'),
+)
+
+
+def test_fake_invoice_lifecycle(fake_facturapi):
+    invoice = facturapi.Invoice.create(invoice_request(CUSTOMER_REQUEST))
+    assert invoice.total == 84.1
+    assert invoice.customer_info.tax_id == 'VAUR631216M55'
+    assert invoice.customer.legal_name == 'Remedios Varo'
+
+    retrieved = facturapi.Invoice.retrieve(invoice.id)
+    assert retrieved.uuid == invoice.uuid
+
+    assert facturapi.Invoice.send_by_email(invoice.id, ['a@b.com'])
+    cancelled = facturapi.Invoice.cancel(invoice.id, motive='02')
+    assert cancelled.status == 'canceled'
+    invoice.refresh()
+    assert invoice.cancellation_status == 'accepted'
+
+
+def test_fake_customers(fake_facturapi):
+    customer = facturapi.Customer.create(CUSTOMER_REQUEST)
+    updated = facturapi.Customer.update(
+        customer.id,
+        facturapi.resources.customers.CustomerUpdateRequest(
+            email='otro@varo.com'
+        ),
+    )
+    assert updated.email == 'otro@varo.com'
+    assert facturapi.Customer.one(q='remedios').id == customer.id
+    assert facturapi.Customer.first(q='frida') is None
+
+
+def test_fake_pagination(fake_facturapi):
+    customer = facturapi.Customer.create(CUSTOMER_REQUEST)
+    for _ in range(5):
+        facturapi.Invoice.create(invoice_request(customer.id))
+    invoices = list(facturapi.Invoice.all(limit=2))
+    assert len(invoices) == 5
+    assert len({invoice.id for invoice in invoices}) == 5
+    assert facturapi.Invoice.count(limit=3) == 3
+
+
+def test_fake_date_filters(fake_facturapi):
+    fake_facturapi.create_customer(
+        dict(legal_name='Frida Kahlo', tax_id='KAFR070706AAA'),
+        created_at='2020-01-01T00:00:00',
+    )
+    fake_facturapi.create_customer(
+        dict(legal_name='Diego Rivera', tax_id='RIDI861208AAA'),
+        created_at='2021-01-01T00:00:00.000Z',
+    )
+    page = facturapi.http.client.get(
+        '/customers', {'date[gte]': '2020-06-01T00:00:00Z'}
+    )
+    assert [c['legal_name'] for c in page['data']] == ['Diego Rivera']
+    page = facturapi.http.client.get(
+        '/customers', {'date[lt]': '2020-06-01', 'date[gt]': '2019-01-01'}
+    )
+    assert [c['legal_name'] for c in page['data']] == ['Frida Kahlo']
+
+
+def test_fake_downloads(fake_facturapi):
+    invoice = facturapi.Invoice.create(invoice_request(CUSTOMER_REQUEST))
+    pdf = facturapi.Invoice.download(invoice.id, FileType.pdf)
+    assert pdf.startswith(b'%PDF')
+    xml = facturapi.Invoice.download(invoice.id, FileType.xml)
+    assert invoice.uuid.encode() in xml
+    archive = zipfile.ZipFile(
+        io.BytesIO(facturapi.Invoice.download(invoice.id, FileType.zip))
+    )
+    assert sorted(archive.namelist()) == [
+        f'{invoice.id}.pdf',
+        f'{invoice.id}.xml',
+    ]
+
+
+def test_fake_errors(fake_facturapi):
+    with pytest.raises(FacturapiResponseException) as e:
+        facturapi.Invoice.retrieve('unknown')
+    assert e.value.status_code == 404
+    with pytest.raises(FacturapiResponseException) as e:
+        facturapi.Invoice.create(invoice_request('unknown'))
+    assert e.value.status_code == 404
+    assert 'Customer' in e.value.json['message']
+    with pytest.raises(FacturapiResponseException) as e:
+        facturapi.Invoice.send_by_email('unknown')
+    assert e.value.status_code == 404
+    for data in (
+        dict(items=[]),
+        dict(customer=CUSTOMER_REQUEST.model_dump(), items=[]),
+        dict(
+            customer=CUSTOMER_REQUEST.model_dump(), items=[dict(product='x')]
+        ),
+    ):
+        with pytest.raises(FacturapiResponseException) as e:
+            facturapi.http.client.post('/invoices', data)
+        assert e.value.status_code == 400
+    with pytest.raises(FacturapiResponseException) as e:
+        facturapi.http.client.delete('/invoices/unknown')
+    assert e.value.status_code == 400
+    with pytest.raises(FacturapiResponseException) as e:
+        facturapi.http.client.post('/customers', dict(legal_name='Frida'))
+    assert e.value.status_code == 400
+    with pytest.raises(FacturapiResponseException) as e:
+        facturapi.http.client.delete('/customers')
+    assert e.value.status_code == 405
+    with pytest.raises(FacturapiResponseException) as e:
+        facturapi.http.client.get('/products')
+    assert e.value.status_code == 404
+
+
+def test_fake_injection():
+    fake = FakeFacturapi(rate_limit_rate=1.0, retry_after=3, latency=0.001)
+    response = fake.handle(httpx.Request('GET', 'https://x/v2/invoices'))
+    assert response.status_code == 429
+    assert response.headers['Retry-After'] == '3'
+
+    fake = FakeFacturapi(error_rate=1.0)
+    response = fake.handle(httpx.Request('GET', 'https://x/v2/invoices'))
+    assert response.status_code == 500
+    assert fake.requests == 1
+
+
+def test_fake_requires_api_key():
+    client = Client(transport=FakeFacturapi().transport)
+    with pytest.raises(FacturapiResponseException) as e:
+        client.get('/invoices')
+    assert e.value.status_code == 401
+
+    client.client.auth = None
+    client.client.headers['Authorization'] = 'Basic not-base64!'
+    with pytest.raises(FacturapiResponseException) as e:
+        client.get('/invoices')
+    assert e.value.status_code == 401
+
+
+def test_fake_serve():
+    fake = FakeFacturapi()
+    client = Client()
+    client.configure('sk_test_fake')
+    client.scheme = 'http'
+    with fake.serve() as host:
+        client.host = host
+        customer = client.post('/customers', CUSTOMER_REQUEST.model_dump())
+        assert client.get(f'/customers/{customer["id"]}') == customer
+        assert fake.customers[customer['id']]['tax_id'] == 'VAUR631216M55'